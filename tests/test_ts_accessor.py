@@ -43,3 +43,114 @@ def test_non_datetime_dataframe(non_datetime_dataframe):
 def test_noname_dataframe(sample_noname_dataframe):
     with pytest.raises(ValueError, match="Index must be named 'Date' and in the pandas datetime format."):
         TimeSeriesAccessor(sample_noname_dataframe)
+
+# Fixture: Sample DataFrame with gaps in its datetime index named Date
+@pytest.fixture
+def gap_dataframe() -> pd.DataFrame:
+    """
+    Fixture for creating a sample DataFrame with a 5-day and a 2-day gap.
+    """
+    index = pd.to_datetime(['2022-01-03', '2022-01-04', '2022-01-10', '2022-01-11', '2022-01-14'])
+    return pd.DataFrame({'value': range(5)}, index=index).rename_axis('Date')
+
+
+def test_find_biggest_gaps(gap_dataframe):
+    gaps = gap_dataframe.ts.find_biggest_gaps(k=5)
+    assert gaps['length'].tolist() == [5, 2]
+
+def test_find_biggest_gaps_business(gap_dataframe):
+    gaps = gap_dataframe.ts.find_biggest_gaps(business=True, k=1)
+    assert gaps['length'].tolist() == [3]
+
+def test_find_biggest_gaps_skips_nat():
+    index = pd.to_datetime(['2022-01-01', None, '2022-01-05', '2022-01-10'])
+    df = pd.DataFrame({'value': range(4)}, index=index).rename_axis('Date')
+    gaps = df.ts.find_biggest_gaps(k=5)
+    assert gaps['length'].tolist() == [4]
+
+def test_fill_forward_business(gap_dataframe):
+    filled = gap_dataframe.ts.fill_forward(business=True)
+    assert len(filled) == 10
+    assert filled.loc['2022-01-07', 'value'] == 1
+
+def test_fill_forward_empty(gap_dataframe):
+    filled = gap_dataframe.iloc[:0].ts.fill_forward(business=False)
+    assert filled.empty
+
+def test_fill_forward_intraday_stamps():
+    index = pd.date_range('2022-01-03 16:00', periods=5, freq='D', name='Date')
+    filled = pd.DataFrame({'value': range(5)}, index=index).ts.fill_forward(business=False)
+    assert filled.index.equals(pd.date_range('2022-01-03', periods=5, freq='D', name='Date'))
+    assert filled['value'].tolist() == [0, 1, 2, 3, 4]
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_report_missing_days(gap_dataframe, capsys, reverse):
+    df = gap_dataframe.iloc[::-1] if reverse else gap_dataframe
+    missing = df.ts.report_missing_days(business=True)
+    expected = pd.to_datetime(['2022-01-05', '2022-01-06', '2022-01-07', '2022-01-12', '2022-01-13'])
+    assert missing.index.equals(expected)
+
+    counts = capsys.readouterr().out.split('Value counts of weekdays for missing days:')[1].split()
+    assert counts[:6] == ['Wednesday', '2', 'Thursday', '2', 'Friday', '1']
+
+@pytest.fixture
+def outlier_dataframe(gap_dataframe) -> pd.DataFrame:
+    """
+    Fixture for creating the gap DataFrame plus one row years after the others.
+    """
+    outlier = pd.DataFrame({'value': [5]}, index=pd.DatetimeIndex(['2030-01-01'], name='Date'))
+    return pd.concat([gap_dataframe, outlier])
+
+def test_segmentize(outlier_dataframe):
+    segments = TimeSeriesAccessor._segmentize(outlier_dataframe.index, 'D')
+    assert segments == [slice(0, 5), slice(5, 6)]
+    assert TimeSeriesAccessor._segmentize(outlier_dataframe.index, 'D', threshold_mult=10_000) == [slice(0, 6)]
+
+def test_fill_forward_outlier(outlier_dataframe):
+    filled = outlier_dataframe.ts.fill_forward(business=False)
+    assert len(filled) == 13
+    assert filled.index[-1] == pd.Timestamp('2030-01-01')
+
+    full = outlier_dataframe.ts.fill_forward(business=False, optimize=False)
+    assert len(full) == len(pd.date_range('2022-01-03', '2030-01-01'))
+    assert full.loc['2029-12-31', 'value'] == 4
+
+def test_report_missing_days_outlier(outlier_dataframe):
+    missing = outlier_dataframe.ts.report_missing_days(business=False)
+    assert len(missing) == 7
+
+    missing = outlier_dataframe.ts.report_missing_days(business=False, optimize=False)
+    assert len(missing) == len(pd.date_range('2022-01-03', '2030-01-01')) - 6
+
+def test_find_gaps_cache_follows_index(gap_dataframe):
+    gaps = gap_dataframe.ts._find_gaps()
+    assert gap_dataframe.ts._find_gaps() is gaps
+
+    gap_dataframe.loc[pd.Timestamp('2022-01-20')] = 5
+    assert len(gap_dataframe.ts._find_gaps()) == 3
+
+def test_transform_investing_historical():
+    raw = pd.DataFrame({'Date': ['01/04/2022', '01/03/2022'], 'Change %': ['-1.50%', '2%']})
+    df = TimeSeriesAccessor.transform_investing_historical(raw)
+    assert df.index.name == 'Date'
+    assert df.index.is_monotonic_increasing
+    assert df['Change %'].dtype == 'float64'
+    assert df['Change %'].tolist() == [2.0, -1.5]
+
+def test_transform_investing_historical_numeric_objects():
+    raw = pd.DataFrame({'Date': ['01/03/2022', '01/04/2022'], 'Change %': pd.Series([2.0, -1.5], dtype=object)})
+    df = TimeSeriesAccessor.transform_investing_historical(raw)
+    assert df['Change %'].tolist() == [2.0, -1.5]
+
+def test_transform_investing_historical_pyarrow_strings():
+    pa = pytest.importorskip('pyarrow')
+    raw = pd.DataFrame({'Date': ['01/03/2022', '01/04/2022'],
+                        'Change %': pd.Series(['2.00%', '-1.50%'], dtype=pd.ArrowDtype(pa.string()))})
+    df = TimeSeriesAccessor.transform_investing_historical(raw)
+    assert df['Change %'].dtype == 'float64'
+    assert df['Change %'].tolist() == [2.0, -1.5]
+
+def test_remove_weekend_days(sample_date_dataframe):
+    weekdays = sample_date_dataframe.ts.remove_weekend_days()
+    assert weekdays.index.equals(pd.DatetimeIndex(['2022-01-03'], name='Date'))
+    assert weekdays['value'].tolist() == [3]
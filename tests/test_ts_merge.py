@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+from TimeSeriesMerge import DataMerger
+
+# Fixture: Two DataFrames with partially overlapping datetime indexes
+@pytest.fixture
+def overlapping_dataframes() -> dict:
+    """
+    Fixture for creating two DataFrames sharing two of their dates.
+    """
+    df1 = pd.DataFrame({'value': [1, 2, 3]}, index=pd.date_range('2022-01-01', periods=3))
+    df2 = pd.DataFrame({'value': [4, 5, 6]}, index=pd.date_range('2022-01-02', periods=3))
+    return {'a': df1, 'b': df2}
+
+
+def test_non_datetime_dataframe():
+    with pytest.raises(ValueError, match="Index of DataFrame a is not in pandas datetime format."):
+        DataMerger({'a': pd.DataFrame({'value': [1, 2, 3]})})
+
+def test_merge_outer(overlapping_dataframes):
+    merged = DataMerger(overlapping_dataframes).merge_outer()
+    assert list(merged.columns) == ['value_a', 'value_b']
+    assert merged.index.equals(pd.date_range('2022-01-01', periods=4))
+    assert merged['value_b'].isna().sum() == 1
+
+def test_merge_inner(overlapping_dataframes):
+    merged = DataMerger(overlapping_dataframes).merge_inner()
+    assert merged.index.equals(pd.date_range('2022-01-02', periods=2))
+    assert merged['value_a'].tolist() == [2, 3]
+    assert merged['value_b'].tolist() == [4, 5]
+    assert (merged.dtypes == 'int64').all()
+
+def test_multiindex_columns_suffixed(overlapping_dataframes):
+    df = overlapping_dataframes['a']
+    df.columns = pd.MultiIndex.from_tuples([('a', 'x')])
+    merger = DataMerger({'m': df})
+    pd.testing.assert_index_equal(merger.dataframes['m'].columns, df.add_suffix('_m').columns)
+
+def test_merge_outer_duplicate_dates():
+    a = pd.DataFrame({'value': [1, 2, 3]}, index=pd.to_datetime(['2022-01-01', '2022-01-01', '2022-01-02']))
+    b = pd.DataFrame({'value': [4, 5]}, index=pd.to_datetime(['2022-01-01', '2022-01-03']))
+    merged = DataMerger({'a': a, 'b': b}).merge_outer()
+    assert len(merged) == 4
+    assert merged['value_b'].tolist()[:2] == [4, 4]
+
+def test_perform_eda_reordered_dataframes(overlapping_dataframes, capsys):
+    merger = DataMerger(overlapping_dataframes)
+    merger.dataframes = {'b': merger.dataframes['b'], 'a': merger.dataframes['a']}
+    merger.perform_eda()
+    rows = capsys.readouterr().out.splitlines()
+    assert next(row for row in rows if row.startswith('b')).split()[1] == '2022-01-02'
+    assert next(row for row in rows if row.startswith('a')).split()[1] == '2022-01-01'
+
+def test_bounds_of_dataframe_added_later(overlapping_dataframes):
+    merger = DataMerger({'a': overlapping_dataframes['a']})
+    late = overlapping_dataframes['b'].iloc[::-1]
+    merger.dataframes['b'] = late
+    assert merger._frame_bounds('b') == (late.index.min(), late.index.max())
+
+def test_merge_single_dataframe(overlapping_dataframes):
+    merger = DataMerger({'a': overlapping_dataframes['a']})
+    pd.testing.assert_frame_equal(merger.merge_outer(), merger.dataframes['a'])
+    pd.testing.assert_frame_equal(merger.merge_inner(), merger.dataframes['a'])
+    for merged in (merger.merge_outer(), merger.merge_inner()):
+        merged.iloc[0, 0] = 999
+    assert overlapping_dataframes['a']['value'].tolist() == [1, 2, 3]
+
+def test_copy_inputs(overlapping_dataframes):
+    original = overlapping_dataframes['a']
+    shared = DataMerger(dict(overlapping_dataframes)).dataframes['a']
+    copied = DataMerger(dict(overlapping_dataframes), copy_inputs=True).dataframes['a']
+    assert np.shares_memory(shared['value_a'].to_numpy(), original['value'].to_numpy())
+    assert not np.shares_memory(copied['value_a'].to_numpy(), original['value'].to_numpy())
+
+def test_merge_inner_numba_engine(overlapping_dataframes):
+    pytest.importorskip('numba')
+    merger = DataMerger(overlapping_dataframes)
+    pd.testing.assert_frame_equal(merger.merge_inner(engine='numba'), merger.merge_inner())
+
+def test_merge_inner_numba_unsorted_dataframe(overlapping_dataframes):
+    pytest.importorskip('numba')
+    merger = DataMerger({'a': overlapping_dataframes['a']})
+    merger.dataframes['b'] = overlapping_dataframes['b'].iloc[::-1]
+    pd.testing.assert_frame_equal(merger.merge_inner(engine='numba'), merger.merge_inner())
+
+@pytest.mark.parametrize('engine', ['pandas', 'numba'])
+def test_merge_inner_duplicate_dates(overlapping_dataframes, engine):
+    overlapping_dataframes['b'] = overlapping_dataframes['b'].iloc[[0, 0, 1]]
+    with pytest.raises(ValueError, match="Index of DataFrame b has duplicate dates."):
+        DataMerger(overlapping_dataframes).merge_inner(engine=engine)
+
+def test_merge_inner_unknown_engine(overlapping_dataframes):
+    with pytest.raises(ValueError, match="Unknown engine"):
+        DataMerger(overlapping_dataframes).merge_inner(engine='spark')
+
+def test_visualize_overlap_empty_dataframe(overlapping_dataframes):
+    matplotlib = pytest.importorskip('matplotlib')
+    matplotlib.use('Agg')
+    overlapping_dataframes['e'] = pd.DataFrame({'value': []}, index=pd.DatetimeIndex([]))
+    DataMerger(overlapping_dataframes).visualize_overlap_stacked()
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import List
 import matplotlib.pyplot as plt
@@ -6,6 +7,20 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_DAY = 86_400_000_000_000
+# Day-of-week codes as returned by DatetimeIndex.dayofweek
+_MONDAY, _SUNDAY = 0, 6
+_WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+# Row budget of the missing data matrix drawn by perform_eda
+_EDA_MAX_ROWS = 50_000
+
+def _split(values, lengths: np.ndarray) -> list:
+    """
+    Cut a flat array into consecutive chunks of the given lengths.
+    """
+    ends = np.cumsum(lengths)
+    return [values[a:b] for a, b in zip(ends - lengths, ends)]
+
 @pd.api.extensions.register_dataframe_accessor("ts")
 class TimeSeriesAccessor:
     def __init__(self, pandas_obj: pd.DataFrame) -> None:
@@ -17,13 +32,16 @@ class TimeSeriesAccessor:
         pandas_obj : pd.DataFrame
             The DataFrame to be accessed.
         """
+        # pandas builds the accessor once per DataFrame and caches it on the
+        # instance, so validation already runs once rather than on every access
         try:
             self._validate(pandas_obj)
-            self._obj = pandas_obj
         except ValueError as e:
-            if str(e)=="Index must be named 'Date' and in the pandas datetime format.":
-                logger.error(str(e))
-                raise
+            logger.error(str(e))
+            raise
+
+        self._obj = pandas_obj
+        self._gaps_cache = None
 
     @staticmethod
     def _validate(obj: pd.DataFrame) -> None:
@@ -37,39 +55,59 @@ class TimeSeriesAccessor:
         obj : pd.DataFrame
             The DataFrame to be validated.
         """
-        if not pd.api.types.is_datetime64_any_dtype(obj.index) or ('Date' not in obj.index.names):
+        # dtype.kind is 'M' for both naive and tz-aware datetime indexes
+        if not (obj.index.name == 'Date' and obj.index.dtype.kind == 'M'):
             raise ValueError("Index must be named 'Date' and in the pandas datetime format.")
 
     def _find_gaps(self) -> pd.DataFrame:
         """
         Find normal and business gaps in data.
+        The result is cached until the DataFrame's index is replaced.
 
         Returns:
         --------
         pd.DataFrame
             DataFrame containing information about consecutive gaps.
         """
-        consecutive_gaps = self._obj.index.to_series().diff().dt.days - 1
-
-        consecutive_gaps = (pd.
-                            DataFrame(consecutive_gaps).
-                            rename(columns={'Date':'days_ago'}).
-                            reset_index().
-                            dropna().
-                            query('days_ago > 0')).dropna()
-
-        consecutive_gaps['days'] = consecutive_gaps.apply(lambda row: pd.date_range(end=row['Date'], periods=int(row['days_ago']), freq='D'), axis=1)
-
-        consecutive_gaps['weekday'] = consecutive_gaps['days'].apply(lambda x: [i.strftime("%A") for i in x])
-        consecutive_gaps['logic_mask'] = (consecutive_gaps['weekday']
-                                          .apply(lambda x: [
-                                              (i not in ['Sunday', 'Monday']) for i in x
-                                          ]
-                                                )
-                                         )
-        consecutive_gaps['business_days'] = consecutive_gaps.apply(lambda x: [value for value, condition in zip(x['days'], x['logic_mask']) if condition], axis=1)
-        consecutive_gaps['business_weekday'] = consecutive_gaps['weekday'].apply(lambda x:[i for i in x if i not in ['Sunday', 'Monday']])
-        consecutive_gaps['business_days_ago'] = consecutive_gaps['business_weekday'].apply(len)
+        index = self._obj.index
+        if self._gaps_cache is not None and self._gaps_cache[0] is index:
+            return self._gaps_cache[1]
+
+        # Whole days between consecutive rows, computed on the int64 view of the index.
+        # NaT is int64 min there, so pairs touching it are left out as no gap.
+        days_ago = np.diff(index.as_unit('ns').asi8) // _NS_PER_DAY - 1
+        nat = index.isna()
+        rows = np.flatnonzero((days_ago > 0) & ~(nat[1:] | nat[:-1])) + 1
+        lengths = days_ago[rows - 1]
+
+        # Expand every gap into its individual days in one pass: a gap of length n
+        # closing at row Date covers Date - (n - 1) days, ..., Date.
+        ends = np.cumsum(lengths)
+        offsets = np.repeat(ends - 1, lengths) - np.arange(lengths.sum())
+
+        # Shift on wall-clock time so tz-aware indexes behave like pd.date_range
+        local = index.tz_localize(None) if index.tz is not None else index
+        days = local[np.repeat(rows, lengths)] - pd.to_timedelta(offsets, unit='D')
+        if index.tz is not None:
+            days = days.tz_localize(index.tz)
+
+        dayofweek = days.dayofweek.to_numpy(dtype=np.int8)
+        logic_mask = (dayofweek != _SUNDAY) & (dayofweek != _MONDAY)
+        weekday = days.day_name().to_numpy()
+        gap_ids = np.repeat(np.arange(len(rows)), lengths)
+        business_days_ago = np.bincount(gap_ids[logic_mask], minlength=len(rows))
+
+        # Filter the flat arrays once, then only cut them into per-gap lists
+        consecutive_gaps = pd.DataFrame({'Date': index[rows], 'days_ago': lengths}, index=rows)
+        consecutive_gaps['days'] = _split(days, lengths)
+        consecutive_gaps['weekday'] = [w.tolist() for w in _split(weekday, lengths)]
+        consecutive_gaps['logic_mask'] = [m.tolist() for m in _split(logic_mask, lengths)]
+        consecutive_gaps['business_days'] = [list(d) for d in _split(days[logic_mask], business_days_ago)]
+        consecutive_gaps['business_weekday'] = [w.tolist() for w in _split(weekday[logic_mask], business_days_ago)]
+        consecutive_gaps['business_days_ago'] = business_days_ago
+
+        # Keep a reference to the index itself so its id cannot be reused
+        self._gaps_cache = (index, consecutive_gaps)
         return consecutive_gaps
 
 
@@ -90,16 +128,15 @@ class TimeSeriesAccessor:
             DataFrame showing top k biggest gaps.
         """
         consecutive_gaps = self._find_gaps()
+        # Rank on the precomputed day counts instead of measuring every list
         if business:
-            gaps = consecutive_gaps[['business_days', 'business_weekday']].rename(columns={'business_days':'days', 'business_weekday':'weekday'})
+            gaps = consecutive_gaps[['business_days', 'business_weekday', 'business_days_ago']].rename(columns={'business_days':'days', 'business_weekday':'weekday', 'business_days_ago':'length'})
         else:
-            gaps = consecutive_gaps[['days', 'weekday']]
+            gaps = consecutive_gaps[['days', 'weekday', 'days_ago']].rename(columns={'days_ago':'length'})
 
         gaps = gaps.reset_index(drop=True)
-        gaps['length'] = gaps['days'].apply(len)
-        gaps = gaps.sort_values("length", ascending=False)
 
-        return gaps.head(k)
+        return gaps.nlargest(k, 'length')
 
 
     def perform_eda(self) -> None:
@@ -107,6 +144,7 @@ class TimeSeriesAccessor:
         Perform exploratory data analysis on each DataFrame.
         Report the start and end period of each data source.
         Use df.info() to show the number of nulls in each column.
+        The missing data matrix plots at most 50,000 evenly spaced rows.
         """
 
         print("===OVERVIEW===")
@@ -120,7 +158,9 @@ class TimeSeriesAccessor:
         plt.tight_layout()
 
         print("===MISSING ROWS===")
-        msno.matrix(self._obj)
+        # Plot a uniform subsample of large frames, it keeps the missingness pattern
+        step = -(-len(self._obj) // _EDA_MAX_ROWS)
+        msno.matrix(self._obj.iloc[::max(1, step)])
 
         # Find the biggest gap in the data
         print("Business gaps:")
@@ -130,7 +170,34 @@ class TimeSeriesAccessor:
         print(self.find_biggest_gaps(business=False))
 
 
-    def fill_forward(self, business: bool = True) -> pd.DataFrame:
+    @staticmethod
+    def _segmentize(idx: pd.DatetimeIndex, freq: str, threshold_mult: int = 1000) -> List[slice]:
+        """
+        Split a sorted index into contiguous segments at gaps wider than
+        threshold_mult periods of freq.
+
+        Parameters:
+        -----------
+        idx : pd.DatetimeIndex
+            The sorted index to be split.
+        freq : str
+            Frequency the segments will be resampled to. Business days are
+            measured as calendar days.
+        threshold_mult : int, optional (default=1000)
+            Number of periods of freq a gap must exceed to start a new segment.
+
+        Returns:
+        --------
+        List[slice]
+            Positional slices of idx, one per segment.
+        """
+        offset = pd.tseries.frequencies.to_offset(freq)
+        nanos = offset.nanos if isinstance(offset, pd.offsets.Tick) else _NS_PER_DAY
+        breaks = np.flatnonzero(np.diff(idx.as_unit('ns').asi8) > threshold_mult * nanos) + 1
+        edges = [0, *breaks, len(idx)]
+        return [slice(a, b) for a, b in zip(edges[:-1], edges[1:])]
+
+    def fill_forward(self, business: bool = True, optimize: bool = True) -> pd.DataFrame:
         """
         Fill forward missing values in the DataFrame.
 
@@ -138,17 +205,50 @@ class TimeSeriesAccessor:
         -----------
         business : bool, optional (default=True)
             If False, fill forward for all days. If True, fill forward only for business days.
+        optimize : bool, optional (default=True)
+            If True, fill each contiguous segment separately so that outlier rows far
+            away from the rest of the data do not blow up the output. Gaps longer than
+            1000 periods are left out of the result instead of being filled.
 
         Returns:
         --------
         pd.DataFrame
             DataFrame with missing values filled forward.
         """
-        if not business:
-            filled_df = self._obj.resample('D').ffill()
-        else:
-            # Fill forward only for business days
-            filled_df = self._obj.resample('B').ffill()
+        obj = self._obj if self._obj.index.is_monotonic_increasing else self._obj.sort_index()
+        if not len(obj):
+            # Nothing to fill, and no first or last date to build a range from
+            return obj.copy()
+
+        freq = 'B' if business else 'D'
+        offset = pd.tseries.frequencies.to_offset(freq)
+        segments = self._segmentize(obj.index, freq) if optimize else [slice(None)]
+
+        filled = []
+        for segment in segments:
+            part = obj.iloc[segment]
+            start, end = part.index[0], part.index[-1]
+            if not business:
+                target = pd.date_range(start, end, freq='D', normalize=True, name='Date')
+            else:
+                # Fill forward only for business days, anchored on the business day
+                # at or before the first row as resample('B') does
+                target = pd.bdate_range(pd.offsets.BDay().rollback(start.normalize()), end, name='Date')
+
+            if len(part) == len(target) and (
+                part.index.equals(target)
+                or pd.tseries.frequencies.to_offset(part.index.inferred_freq) == offset
+            ):
+                # One row per period already: relabel the rows onto the target dates
+                # as resample does, e.g. for daily rows stamped at a fixed time of day
+                piece = part.copy()
+                piece.index = target
+                filled.append(piece)
+            else:
+                # Reindexing onto the target dates skips resample's binning machinery
+                filled.append(part.reindex(target, method='ffill'))
+
+        filled_df = pd.concat(filled) if len(filled) > 1 else filled[0]
 
         return filled_df
 
@@ -162,12 +262,12 @@ class TimeSeriesAccessor:
             DataFrame with weekend days removed.
         """
         # Remove rows where the day of the week is Saturday (5) or Sunday (6)
-        df_no_weekends = self._obj[self._obj.index.to_series().dt.dayofweek < 5]
+        df_no_weekends = self._obj.iloc[np.flatnonzero(self._obj.index.dayofweek < 5)]
 
         return df_no_weekends
 
 
-    def report_missing_days(self, business=True) -> pd.Series:
+    def report_missing_days(self, business=True, optimize: bool = True) -> pd.Series:
         """
         Report missing days in a DataFrame.
         Include value counts of weekdays for the missing days.
@@ -176,6 +276,9 @@ class TimeSeriesAccessor:
         -----------
         business: bool, optional (default=True)
             If True, reports only for missing business days.
+        optimize : bool, optional (default=True)
+            If True, only look for missing days within contiguous segments of the
+            index; gaps longer than 1000 days are not reported day by day.
 
         Returns:
         --------
@@ -189,10 +292,22 @@ class TimeSeriesAccessor:
             freq = 'D'
 
         # Create a date range of all working days in the DataFrame's date range
-        all_days = pd.date_range(start=dates.min(), end=dates.max(), freq=freq)
+        if optimize:
+            sorted_dates = dates if dates.is_monotonic_increasing else dates.sort_values()
+            ranges = [pd.date_range(start=sorted_dates[segment][0], end=sorted_dates[segment][-1], freq=freq)
+                      for segment in self._segmentize(sorted_dates, freq)]
+            all_days = ranges[0].append(ranges[1:])
+        else:
+            all_days = pd.date_range(start=dates.min(), end=dates.max(), freq=freq)
 
-        # Find missing working days
-        missing_days = all_days.difference(dates)
+        # Find missing working days with a sorted merge on the int64 views,
+        # both sides are already ordered so no hash table is needed
+        have = dates.as_unit('ns').asi8
+        if not dates.is_monotonic_increasing:
+            have = np.sort(have)
+        want = all_days.as_unit('ns').asi8
+        found = have[np.searchsorted(have, want).clip(max=len(have) - 1)] == want
+        missing_days = all_days[~found]
 
         # Report missing working days and value counts of weekdays
         if not missing_days.empty:
@@ -200,7 +315,10 @@ class TimeSeriesAccessor:
             print(missing_days)
 
             # Calculate value counts of weekdays for missing working days
-            missing_weekday_counts = pd.Series(missing_days.to_series().dt.day_name()).value_counts()
+            counts = np.bincount(missing_days.dayofweek.to_numpy(), minlength=7)
+            missing_weekday_counts = (pd.Series(counts, index=_WEEKDAY_NAMES, name='count')
+                                      .loc[counts > 0]
+                                      .sort_values(ascending=False, kind='stable'))
 
             print("\nValue counts of weekdays for missing days:")
             print(missing_weekday_counts)
@@ -227,12 +345,13 @@ class TimeSeriesAccessor:
         """
         assert 'Date' in df.columns, "The 'Date' column is missing."
 
-        # Convert the 'Date' column to date format
-        df['Date'] = pd.to_datetime(df['Date'], format=format)
+        # Convert the 'Date' column to date format, parsing each distinct date once
+        df['Date'] = pd.to_datetime(df['Date'], format=format, cache=True)
 
         if "Change %" in df.columns:
             # Convert the 'Change' column to float (remove the % sign)
-            if pd.api.types.is_string_dtype(df['Change %']):
-                df['Change %'] = df['Change %'].str.rstrip('%').astype('float')
+            change = df['Change %']
+            if pd.api.types.is_string_dtype(change):
+                df['Change %'] = pd.to_numeric(change.str.replace('%', '', regex=False)).astype('float')
 
         return df.set_index('Date').sort_index()
@@ -1,7 +1,69 @@
+import numpy as np
 import pandas as pd
-import missingno as msno
-from typing import Dict, Union
-from matplotlib import pyplot as plt
+from functools import reduce
+from typing import Dict, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Row budget of the matrix drawn by visualize_missing_data
+_MISSING_MATRIX_MAX_ROWS = 1_000
+# _k_way_intersect compiled by numba, built the first time the numba engine runs
+_k_way_intersect_jit = None
+
+
+def _k_way_intersect(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Intersect k sorted int64 arrays stored back to back in values, array j
+    spanning values[offsets[j]:offsets[j + 1]]. One pointer walks each array
+    and the ones behind the largest head are advanced until all heads match.
+    """
+    k = len(offsets) - 1
+    pos = offsets[:-1].copy()
+    size = offsets[1] - offsets[0]
+    for j in range(1, k):
+        size = min(size, offsets[j + 1] - offsets[j])
+    out = np.empty(size, np.int64)
+    n = 0
+
+    while True:
+        for j in range(k):
+            if pos[j] >= offsets[j + 1]:
+                return out[:n]
+
+        target = values[pos[0]]
+        for j in range(1, k):
+            target = max(target, values[pos[j]])
+
+        matched = True
+        for j in range(k):
+            while pos[j] < offsets[j + 1] and values[pos[j]] < target:
+                pos[j] += 1
+            if pos[j] >= offsets[j + 1]:
+                return out[:n]
+            if values[pos[j]] != target:
+                matched = False
+
+        if matched:
+            out[n] = target
+            n += 1
+            for j in range(k):
+                pos[j] += 1
+
+
+def _compiled_k_way_intersect():
+    """
+    Return _k_way_intersect compiled with numba, or None if numba is not installed.
+    numba is only imported the first time this is called.
+    """
+    global _k_way_intersect_jit
+    if _k_way_intersect_jit is None:
+        try:
+            import numba
+        except ImportError:
+            return None
+        _k_way_intersect_jit = numba.njit(cache=True)(_k_way_intersect)
+    return _k_way_intersect_jit
 
 
 class DataMerger:
@@ -12,6 +74,11 @@ class DataMerger:
     -----------
     dataframes : dict
         A dictionary of DataFrames where keys are names and values are pandas DataFrames.
+    copy_inputs : bool, optional (default=False)
+        If True, take a consolidated copy of every DataFrame up front. This costs one
+        copy of the data but avoids very slow concatenation of frames that are views
+        over external buffers (e.g. read from HDF5 or Arrow). Otherwise the merger
+        shares the column data of the given DataFrames.
 
     Raises:
     -------
@@ -45,107 +112,264 @@ class DataMerger:
 
     """
 
-    def __init__(self, dataframes: Dict[str, pd.DataFrame]):
+    def __init__(self, dataframes: Dict[str, pd.DataFrame], copy_inputs: bool = False):
         self.dataframes = dataframes
+        self.copy_inputs = copy_inputs
         self._check_index_format()
 
     def _check_index_format(self) -> None:
         """
         Check if the indexes of all DataFrames have the pandas datetime format.
         Raises a ValueError if not.
+
+        The start and end date of each DataFrame are cached.
+        """
+        for item in list(self.dataframes.items()):
+            name, df = self._prepare_one(item, copy=self.copy_inputs)
+            self.dataframes[name] = df
+
+        self._bounds = {}
+        for name in self.dataframes:
+            self._frame_bounds(name)
+
+    def _frame_bounds(self, name: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Return the start and end date of a DataFrame.
+        The bounds are cached per DataFrame object and computed on first use,
+        so DataFrames added or replaced after construction are covered too.
+        """
+        df = self.dataframes[name]
+        cached = self._bounds.get(name)
+        if cached is None or cached[0] is not df:
+            index = df.index
+            if not len(index):
+                bounds = (pd.NaT, pd.NaT)
+            elif index.is_monotonic_increasing:
+                bounds = (index[0], index[-1])
+            else:
+                bounds = (index.min(), index.max())
+            cached = self._bounds[name] = (df, bounds)
+        return cached[1]
+
+    @staticmethod
+    def _prepare_one(item: Tuple[str, pd.DataFrame], copy: bool = False) -> Tuple[str, pd.DataFrame]:
+        """
+        Validate a (name, DataFrame) pair, sort the DataFrame by index
+        and suffix its columns with the name.
+        Raises a ValueError if the index is not in the pandas datetime format.
+
+        Parameters:
+        -----------
+        item : tuple
+            The name and the DataFrame.
+        copy : bool, optional (default=False)
+            If True, the returned DataFrame owns a fresh copy of the data.
+
+        Returns:
+        --------
+        tuple
+            The name and the suffixed DataFrame.
         """
-        for name, df in self.dataframes.items():
-            if not pd.api.types.is_datetime64_any_dtype(df.index):
-                raise ValueError(
-                    f"Index of DataFrame {name} is not in pandas datetime format."
-                )
+        name, df = item
+        if not pd.api.types.is_datetime64_any_dtype(df.index):
+            raise ValueError(
+                f"Index of DataFrame {name} is not in pandas datetime format."
+            )
 
-            self.dataframes[name] = df.add_suffix(f'_{name}')
+        # Sort once up front so the merges never have to; sorting already copies
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        elif copy:
+            df = df.copy()
+
+        # set_axis shares the column data, add_suffix would copy all of it.
+        # Like add_suffix, every level of MultiIndex columns is suffixed.
+        suffix = f'_{name}'
+        if isinstance(df.columns, pd.MultiIndex):
+            columns = pd.MultiIndex.from_tuples(
+                [tuple(f'{level}{suffix}' for level in column) for column in df.columns],
+                names=df.columns.names,
+            )
+        else:
+            columns = pd.Index([f'{column}{suffix}' for column in df.columns], name=df.columns.name)
+        return name, df.set_axis(columns, axis=1, copy=False)
 
     def perform_eda(self) -> None:
         """
         Perform exploratory data analysis on each DataFrame.
-        Report the start and end period of each data source.
-        Use df.info() to show the number of nulls in each column.
+        Report the start and end period, the shape and the number of nulls
+        of each data source in a single summary table.
         """
-        for name, df in self.dataframes.items():
-            print(f"\nExploratory Data Analysis for {name}:")
-            print(f"Start Date: {df.index.min()}")
-            print(f"End Date: {df.index.max()}")
-            print("\nInfo:")
-            print(df.info())
+        frames = self.dataframes.values()
+        # Look the bounds up by name so they line up with the frames' order
+        bounds = [self._frame_bounds(name) for name in self.dataframes]
+        summary = pd.DataFrame(
+            {
+                'start': [start_date for start_date, _ in bounds],
+                'end': [end_date for _, end_date in bounds],
+                'nrows': [len(df) for df in frames],
+                'ncols': [df.shape[1] for df in frames],
+                # One reduction over each null mask instead of df.info()'s per-column counts
+                'nulls': [int(df.isna().values.sum()) for df in frames],
+            },
+            index=list(self.dataframes),
+        )
+
+        print("\nExploratory Data Analysis:")
+        print(summary.to_string())
 
 
     def merge_outer(self) -> pd.DataFrame:
         """
         Perform an outer join on all DataFrames and store the result in self.merged_data.
         """
-        merged_data = pd.DataFrame()
-        for name, df in self.dataframes.items():
-            merged_data = pd.merge(
-                merged_data,
-                df,
-                left_index=True,
-                right_index=True,
-                how='outer',
+        # A single DataFrame has nothing to align against
+        if len(self.dataframes) == 1:
+            return next(iter(self.dataframes.values())).copy()
+
+        frames = self.dataframes.values()
+        if all(df.index.is_unique for df in frames):
+            merged_data = pd.concat(frames, axis=1, join='outer', sort=False)
+        else:
+            # concat cannot align duplicate dates, pd.merge pairs them up instead
+            merged_data = reduce(
+                lambda left, right: pd.merge(left, right, left_index=True, right_index=True, how='outer'),
+                frames,
             )
 
         return merged_data
 
-    def merge_inner(self) -> Union[None, pd.DataFrame]:
+    def merge_inner(self, engine: str = 'pandas') -> Union[None, pd.DataFrame]:
         """
         Perform an inner join on all DataFrames.
         Report the number of rows in the final result, start and end date of the result.
 
+        Parameters:
+        -----------
+        engine : str, optional (default='pandas')
+            'pandas' or 'numba'. The numba engine intersects the sorted indexes with
+            a compiled k-way merge. It needs the optional numba package (the 'numba'
+            extra); without it, or if an index is not sorted, pandas is used.
+
         Returns:
         --------
         pd.DataFrame or None:
             The inner-joined DataFrame or None if the merged DataFrame is empty.
+
+        Raises:
+        -------
+        ValueError:
+            If the engine is unknown or an index holds duplicate dates.
         """
-        inner_merged_data = pd.concat(
-            self.dataframes.values(),
-            axis=1,
-            join='inner',
-            sort=True,
-        )
+        if engine not in ('pandas', 'numba'):
+            raise ValueError(f"Unknown engine {engine!r}, expected 'pandas' or 'numba'.")
+
+        if len(self.dataframes) > 1:
+            for name, df in self.dataframes.items():
+                if not df.index.is_unique:
+                    raise ValueError(f"Index of DataFrame {name} has duplicate dates.")
+
+        k_way_intersect = None
+        if engine == 'numba':
+            k_way_intersect = _compiled_k_way_intersect()
+            if k_way_intersect is None:
+                logger.warning("numba is not installed, falling back to the pandas engine.")
+                engine = 'pandas'
+            elif not all(df.index.is_monotonic_increasing for df in self.dataframes.values()):
+                # DataFrames added after construction may be unsorted, the k-way merge needs sorted input
+                logger.warning("An index is not sorted, falling back to the pandas engine.")
+                engine = 'pandas'
+
+        if len(self.dataframes) == 1:
+            inner_merged_data = next(iter(self.dataframes.values())).copy()
+        elif engine == 'numba':
+            inner_merged_data = self._merge_inner_numba(k_way_intersect)
+        else:
+            # Every index is sorted, so concat intersects them with a merge join
+            inner_merged_data = pd.concat(
+                self.dataframes.values(),
+                axis=1,
+                join='inner',
+                sort=False,
+            )
 
         if not inner_merged_data.empty:
             print(f"\nInner Join Result:")
             print(f"Number of Rows: {len(inner_merged_data)}")
-            print(f"Start Date: {inner_merged_data.index.min()}")
-            print(f"End Date: {inner_merged_data.index.max()}")
+            print(f"Start Date: {inner_merged_data.index[0]}")
+            print(f"End Date: {inner_merged_data.index[-1]}")
             return inner_merged_data
         else:
             print("Inner Join Result is empty.")
             return None
 
+    def _merge_inner_numba(self, k_way_intersect) -> pd.DataFrame:
+        """
+        Inner join all DataFrames on their index with the compiled k-way intersection.
+        Every index must be sorted and free of duplicates.
+        """
+        frames = list(self.dataframes.values())
+        views = [df.index.as_unit('ns').asi8 for df in frames]
+        offsets = np.cumsum([0] + [len(view) for view in views])
+        common = k_way_intersect(np.concatenate(views), offsets)
+        first = frames[0].index
+        common_index = first[np.isin(first.as_unit('ns').asi8, common, assume_unique=True)]
+        if any(df.index.name != first.name for df in frames):
+            common_index = common_index.rename(None)
+
+        # Gather the common rows by position: every view is sorted, and take
+        # never introduces missing values so integer columns keep their dtype
+        return pd.concat(
+            [df.take(np.searchsorted(view, common)).set_axis(common_index, axis=0, copy=False)
+             for df, view in zip(frames, views)],
+            axis=1,
+        )
+
     @staticmethod
     def visualize_missing_data(df) -> None:
         """
         Use missingno to visualize missing data in the DataFrame.
+        Frames longer than 1,000 rows are drawn from evenly spaced rows.
         """
-        msno.matrix(df)
+        # Plotting libraries are imported lazily so merging alone never loads them
+        import missingno as msno
+
+        # A strided iloc is a view, and bounds the raster whatever the row count
+        step = -(-len(df) // _MISSING_MATRIX_MAX_ROWS)
+        msno.matrix(df.iloc[::max(1, step)])
 
 
     def visualize_overlap_stacked(self):
         """
         Visualize the time overlap between DataFrames in the DataMerger object with stacked lines.
         """
+        from matplotlib import pyplot as plt
+
         df_names = list(self.dataframes.keys())
 
         plt.style.use('ggplot')  # Set the theme to 'ggplot'
         fig, ax = plt.subplots(figsize=(8, len(self.dataframes)))
 
-        for i, name in enumerate(df_names):
-            start_date = self.dataframes[name].index.min()
-            end_date = self.dataframes[name].index.max()
-            ax.plot([start_date, end_date], [i, i], label=name, marker='o', linestyle='-')
+        # Wall-clock bounds for tz-aware indexes; all labels are formatted in one call
+        bounds = [self._frame_bounds(name) for name in df_names]
+        # Going through DatetimeIndex keeps the NaT bounds of empty DataFrames
+        starts = pd.DatetimeIndex([start.tz_localize(None) for start, _ in bounds]).to_numpy()
+        ends = pd.DatetimeIndex([end.tz_localize(None) for _, end in bounds]).to_numpy()
+        start_labels = np.datetime_as_string(starts, unit='D')
+        end_labels = np.datetime_as_string(ends, unit='D')
+
+        # Draw every line and marker with one artist each instead of one plot() per source
+        ys = np.arange(len(df_names))
+        colors = [f'C{i}' for i in ys]
+        ax.hlines(ys, starts, ends, colors=colors)
+        ax.scatter(np.concatenate([starts, ends]), np.concatenate([ys, ys]), c=colors * 2, zorder=3)
 
+        for i in ys:
             # Annotate start date
-            ax.annotate(start_date.strftime('%Y-%m-%d'), (start_date, i), textcoords="offset points", xytext=(0, 10), ha='center')
+            ax.annotate(start_labels[i], (starts[i], i), textcoords="offset points", xytext=(0, 10), ha='center')
 
             # Annotate end date
-            ax.annotate(end_date.strftime('%Y-%m-%d'), (end_date, i), textcoords="offset points", xytext=(0, 10), ha='center')
+            ax.annotate(end_labels[i], (ends[i], i), textcoords="offset points", xytext=(0, 10), ha='center')
 
         ax.set_yticks(range(len(df_names)))
         ax.set_yticklabels(df_names)